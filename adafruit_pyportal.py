@@ -98,6 +98,10 @@ TIME_SERVICE_STRFTIME = (
     "&fmt=%25Y-%25m-%25d+%25H%3A%25M%3A%25S.%25L+%25j+%25u+%25z+%25Z"
 )
 LOCALFILE = "local.txt"
+# glyphs loaded up front for the text and caption fonts, enough for most data and numbers
+PRELOAD_GLYPHS = (
+    b"0123456789abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ-!,. \"'?!:/_%"
+)
 # pylint: enable=line-too-long
 
 
@@ -115,6 +119,59 @@ class Fake_Requests:
 
         return json.loads(self.text)
 
+    @property
+    def content(self):
+        """The local file as bytes."""
+        return self.text.encode("utf-8")
+
+    def close(self):
+        """Nothing to close for local requests."""
+
+
+class _SocketStream:
+    """File-like reader over a response socket, so ``json.load`` can parse the body
+    in small chunks instead of from one big string."""
+
+    def __init__(self, sock, content_length=None, buffer_size=512):
+        self._sock = sock
+        self._remaining = content_length
+        self._buffer = bytearray(buffer_size)
+        self._start = 0
+        self._end = 0
+
+    def readinto(self, buf, nbytes=None):
+        """Read up to ``nbytes`` (default ``len(buf)``) bytes of the body into ``buf``."""
+        size = len(buf) if nbytes is None else nbytes
+        if self._remaining is not None:
+            size = min(size, self._remaining)
+        if size <= 0:
+            return 0
+        # recv() rather than recv_into(), as only recv() returns the body bytes
+        # that reading the headers left in the socket's own buffer
+        data = self._sock.recv(size)
+        count = len(data)
+        buf[:count] = data
+        if self._remaining is not None:
+            self._remaining -= count
+        return count
+
+    def read(self, size=-1):
+        """Read ``size`` bytes of the body, or all of what is left if ``size`` is negative."""
+        if size is None or size < 0:
+            chunks = []
+            while True:
+                chunk = self.read(len(self._buffer))
+                if not chunk:
+                    return b"".join(chunks)
+                chunks.append(chunk)
+        if self._start == self._end:
+            self._start = 0
+            self._end = self.readinto(self._buffer)
+        count = min(size, self._end - self._start)
+        chunk = bytes(self._buffer[self._start : self._start + count])
+        self._start += count
+        return chunk
+
 
 class PyPortal:
     """Class representing the Adafruit PyPortal.
@@ -223,7 +280,13 @@ class PyPortal:
         else:
             self._json_path = None
 
-        self._regexp_path = regexp_path
+        if regexp_path:
+            import re  # pylint: disable=import-outside-toplevel
+
+            # compile once here rather than on every fetch()
+            self._regexp_path = [re.compile(regexp) for regexp in regexp_path]
+        else:
+            self._regexp_path = None
         self._success_callback = success_callback
 
         if status_neopixel:
@@ -246,8 +309,16 @@ class PyPortal:
             print("Init background")
         self._bg_group = displayio.Group(max_size=1)
         self._bg_file = None
+        self._bg_filename = None
+        self._bg_position = None
+        self._bg_sprite = None
+        self._bg_file_sprite = None
         self._default_bg = default_bg
         self.splash.append(self._bg_group)
+        # display updates wait for one frame at the end of each public call,
+        # or at the end of fetch() for everything it changed
+        self._pending_refresh = False
+        self._hold_refresh = False
 
         # show thank you and bootup file if available
         for bootscreen in ("/thankyou.bmp", "/pyportal_startup.bmp"):
@@ -257,12 +328,8 @@ class PyPortal:
                 for i in range(100, -1, -1):  # dim down
                     self.set_backlight(i / 100)
                     time.sleep(0.005)
-                self.set_background(bootscreen)
-                try:
-                    board.DISPLAY.refresh(target_frames_per_second=60)
-                except AttributeError:
-                    board.DISPLAY.wait_for_frame()
-                for i in range(100):  # dim up
+                self.set_background(bootscreen)  # waits for the frame to be drawn
+                for i in range(101):  # dim up
                     self.set_backlight(i / 100)
                     time.sleep(0.005)
                 time.sleep(2)
@@ -336,6 +403,7 @@ class PyPortal:
         except OSError as error:
             print("No SD card found:", error)
 
+        self._wget_buf = None
         self._qr_group = None
         # Tracks whether we've hidden the background when we showed the QR code.
         self._qr_only = False
@@ -345,6 +413,7 @@ class PyPortal:
         self._caption = None
         if caption_font:
             self._caption_font = bitmap_font.load_font(caption_font)
+            self._caption_font.load_glyphs(PRELOAD_GLYPHS)
         self.set_caption(caption_text, caption_position, caption_color)
 
         if text_font:
@@ -369,12 +438,11 @@ class PyPortal:
             self._text_wrap = [None] * num
             self._text_maxlen = [None] * num
             self._text_transform = [None] * num
+            self._text_slot = [None] * num  # where each text area sits in splash
             self._text_font = bitmap_font.load_font(text_font)
             if self._debug:
                 print("Loading font glyphs")
-            # self._text_font.load_glyphs(b'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz'
-            #                             b'0123456789:/-_,. ')
-            gc.collect()
+            self._text_font.load_glyphs(PRELOAD_GLYPHS)
 
             for i in range(num):
                 if self._debug:
@@ -425,8 +493,6 @@ class PyPortal:
                 size=(board.DISPLAY.width, board.DISPLAY.height),
             )
             # pylint: enable=no-member
-
-            self.set_backlight(1.0)  # turn on backlight
         elif hasattr(board, "BUTTON_CLOCK"):
             if self._debug:
                 print("Init cursor")
@@ -449,10 +515,15 @@ class PyPortal:
         """
         self._headers = headers
 
-    def set_background(self, file_or_color, position=None):
+    def set_background(self, file_or_color, position=None, *, reload=False):
         """The background image to a bitmap file.
 
         :param file_or_color: The filename of the chosen background image, or a hex color.
+        :param position: Optional x and y coordinates of the top left of the image.
+        :param bool reload: Open the file again even if it is the one already shown at
+                            this position. Setting the same filename again reuses the
+                            bitmap that was read from it, so pass ``True`` if the file has
+                            been changed by something other than ``wget()``.
 
         """
         print("Set background to ", file_or_color)
@@ -464,9 +535,17 @@ class PyPortal:
 
         if not file_or_color:
             return  # we're done, no background desired
-        if self._bg_file:
-            self._bg_file.close()
-        if isinstance(file_or_color, str):  # its a filenme:
+        if (
+            not reload
+            and file_or_color == self._bg_filename
+            and tuple(position) == self._bg_position
+        ):
+            # same file in the same place, the sprite we made for it is still good
+            self._bg_sprite = self._bg_file_sprite
+        elif isinstance(file_or_color, str):  # its a filenme:
+            if self._bg_file:
+                self._bg_file.close()
+            self._bg_filename = None
             self._bg_file = open(file_or_color, "rb")
             background = displayio.OnDiskBitmap(self._bg_file)
             try:
@@ -482,11 +561,13 @@ class PyPortal:
                     x=position[0],
                     y=position[1],
                 )
+            self._bg_file_sprite = self._bg_sprite
+            self._bg_filename = file_or_color
+            self._bg_position = tuple(position)
         elif isinstance(file_or_color, int):
-            # Make a background color fill
-            color_bitmap = displayio.Bitmap(
-                board.DISPLAY.width, board.DISPLAY.height, 1
-            )
+            # Make a background color fill, keeping any file open to switch back to
+            display = board.DISPLAY
+            color_bitmap = displayio.Bitmap(display.width, display.height, 1)
             color_palette = displayio.Palette(1)
             color_palette[0] = file_or_color
             try:
@@ -503,13 +584,21 @@ class PyPortal:
         else:
             raise RuntimeError("Unknown type of background")
         self._bg_group.append(self._bg_sprite)
+        self._pending_refresh = True
+        gc.collect()
+        self._flush_display()
+
+    def _flush_display(self):
+        """Wait for the display to show any pending changes, unless fetch() is batching them."""
+        if not self._pending_refresh or self._hold_refresh:
+            return
+        self._pending_refresh = False
+        display = board.DISPLAY
         try:
-            board.DISPLAY.refresh(target_frames_per_second=60)
-            gc.collect()
+            display.refresh(target_frames_per_second=60)
         except AttributeError:
-            board.DISPLAY.refresh_soon()
-            gc.collect()
-            board.DISPLAY.wait_for_frame()
+            display.refresh_soon()
+            display.wait_for_frame()
 
     def set_backlight(self, val):
         """Adjust the TFT backlight.
@@ -535,7 +624,7 @@ class PyPortal:
         """
         # pylint: enable=line-too-long
         if not glyphs:
-            glyphs = b"0123456789abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ-!,. \"'?!"
+            glyphs = PRELOAD_GLYPHS
         print("Preloading font glyphs:", glyphs)
         if self._text_font:
             self._text_font.load_glyphs(glyphs)
@@ -561,11 +650,8 @@ class PyPortal:
             self._caption._update_text(  # pylint: disable=protected-access
                 str(caption_text)
             )
-            try:
-                board.DISPLAY.refresh(target_frames_per_second=60)
-            except AttributeError:
-                board.DISPLAY.refresh_soon()
-                board.DISPLAY.wait_for_frame()
+            self._pending_refresh = True
+            self._flush_display()
             return
 
         self._caption = Label(self._caption_font, text=str(caption_text))
@@ -589,13 +675,21 @@ class PyPortal:
                 # print("Replacing text area with :", string)
                 # self._text[index].text = string
                 # return
-                try:
-                    text_index = self.splash.index(self._text[index])
-                except AttributeError:
-                    for i in range(len(self.splash)):
-                        if self.splash[i] == self._text[index]:
-                            text_index = i
-                            break
+                text_index = self._text_slot[index]
+                if not (
+                    text_index < len(self.splash)
+                    and self.splash[text_index] == self._text[index]
+                ):  # splash was rearranged since, look for it again
+                    try:
+                        text_index = self.splash.index(self._text[index])
+                    except AttributeError:
+                        for i in range(len(self.splash)):
+                            if self.splash[i] == self._text[index]:
+                                text_index = i
+                                break
+                        else:
+                            raise ValueError("text area is not in splash")
+                    self._text_slot[index] = text_index
 
                 self._text[index] = Label(self._text_font, text=string)
                 self._text[index].color = self._text_color[index]
@@ -610,6 +704,7 @@ class PyPortal:
                 self._text[index].color = self._text_color[index]
                 self._text[index].x = self._text_position[index][0]
                 self._text[index].y = self._text_position[index][1]
+                self._text_slot[index] = len(self.splash)
                 self.splash.append(self._text[index])
 
     def neo_status(self, value):
@@ -643,9 +738,148 @@ class PyPortal:
         value = json
         for x in path:
             value = value[x]
-            gc.collect()
         return value
 
+    @staticmethod
+    def _body_socket(response):
+        """The socket to read the body of ``response`` from directly, or ``None`` if that
+        isn't possible and the response's own methods have to be used."""
+        sock = getattr(response, "socket", None)
+        if (
+            sock is None
+            or hasattr(response, "_readinto")  # newer requests buffer the body
+            or getattr(response, "_cached", None) is not None  # body already read
+        ):
+            return None
+        return sock
+
+    @staticmethod
+    def _stream_json(response):
+        """Parse the JSON body of ``response`` straight off its socket, so the whole body
+        never has to be held in memory as a string alongside the parsed result."""
+        sock = PyPortal._body_socket(response)
+        if sock is None:
+            return response.json()
+        import json  # pylint: disable=import-outside-toplevel
+
+        content_length = response.headers.get("content-length")
+        if content_length is not None:
+            content_length = int(content_length)
+        return json.load(_SocketStream(sock, content_length))
+
+    @staticmethod
+    def _extract_paths(data, paths):
+        """Pull only the values at ``paths`` out of the JSON bytes ``data``, in a single scan.
+
+        Returns a sparse copy of the document holding just those values, which
+        ``_json_traverse`` can walk like the full one; everything else is skipped
+        unparsed. Bytes are scanned rather than text, as indexing a (UTF-8) str is not
+        constant time.
+        """
+        import json  # pylint: disable=import-outside-toplevel
+
+        wanted = set(tuple(path) for path in paths if path)
+        prefixes = set()
+        for path in wanted:
+            for i in range(len(path)):
+                prefixes.add(path[:i])
+        skipped = object()
+        todo = [len(wanted)]
+        quote, backslash, colon, comma, lbrace = tuple(b'"\\:,{')
+        whitespace = tuple(b" \t\r\n")
+        openers = tuple(b"{[")
+        closers = tuple(b"}]")
+        value_end = tuple(b",}] \t\r\n")
+
+        def skip_ws(i):
+            while data[i] in whitespace:
+                i += 1
+            return i
+
+        # i is at the opening quote, returns the index past the closing one
+        def skip_string(i):
+            i = data.find(b'"', i + 1)
+            while True:
+                if i < 0:
+                    raise ValueError("Unterminated string in JSON")
+                backslashes = 0
+                while data[i - 1 - backslashes] == backslash:
+                    backslashes += 1
+                if not backslashes % 2:
+                    return i + 1
+                i = data.find(b'"', i + 1)
+
+        def skip_value(i):
+            if data[i] == quote:
+                return skip_string(i)
+            if data[i] in openers:
+                depth = 0
+                while True:
+                    char = data[i]
+                    if char == quote:
+                        i = skip_string(i)
+                        continue
+                    if char in openers:
+                        depth += 1
+                    elif char in closers:
+                        depth -= 1
+                        if not depth:
+                            return i + 1
+                    i += 1
+            while i < len(data) and data[i] not in value_end:
+                i += 1
+            return i
+
+        # returns the index past the value at i, and that value cut down to the parts
+        # on the wanted paths (skipped if none are)
+        def walk(i, path):
+            if path in wanted:
+                end = skip_value(i)
+                todo[0] -= 1
+                return end, json.loads(str(data[i:end], "utf-8"))
+            if path not in prefixes:
+                return skip_value(i), skipped
+            if data[i] not in openers:  # e.g. a string indexed into, keep all of it
+                end = skip_value(i)
+                return end, json.loads(str(data[i:end], "utf-8"))
+            is_object = data[i] == lbrace
+            # lists keep their positions (None where skipped), so indices past the
+            # end still raise IndexError like they would on the full document
+            node = {} if is_object else []
+            i = skip_ws(i + 1)
+            if data[i] in closers:
+                return i + 1, node
+            while True:
+                if is_object:
+                    end = skip_string(i)
+                    if data.find(b"\\", i + 1, end - 1) < 0:
+                        key = str(data[i + 1 : end - 1], "utf-8")
+                    else:
+                        key = json.loads(str(data[i:end], "utf-8"))
+                    i = skip_ws(end)
+                    if data[i] != colon:
+                        raise ValueError("Expected ':' in JSON")
+                    i = skip_ws(i + 1)
+                    i, value = walk(i, path + (key,))
+                    if value is not skipped:
+                        node[key] = value
+                else:
+                    i, value = walk(i, path + (len(node),))
+                    node.append(None if value is skipped else value)
+                if not todo[0]:
+                    return i, node
+                i = skip_ws(i)
+                if data[i] != comma:
+                    return i + 1, node
+                i = skip_ws(i + 1)
+
+        if not wanted:
+            return {}
+        try:
+            return walk(skip_ws(0), ())[1]
+        except IndexError:
+            raise ValueError("Truncated JSON")
+
     def get_local_time(self, location=None):
         # pylint: disable=line-too-long
         """Fetch and "set" the local time of this microcontroller to the local time at the location, using an internet time API.
@@ -676,22 +910,25 @@ class PyPortal:
             response = requests.get(api_url, timeout=10)
             if response.status_code != 200:
                 raise ValueError(response.text)
+            reply = response.text
             if self._debug:
                 print("Time request: ", api_url)
-                print("Time reply: ", response.text)
-            times = response.text.split(" ")
-            the_date = times[0]
-            the_time = times[1]
-            year_day = int(times[2])
-            week_day = int(times[3])
+                print("Time reply: ", reply)
+            # TIME_SERVICE_STRFTIME gives a fixed layout, so the fields are read by position:
+            # "YYYY-MM-DD HH:MM:SS.mmm jjj u ..."
+            year = int(reply[0:4])
+            month = int(reply[5:7])
+            mday = int(reply[8:10])
+            hours = int(reply[11:13])
+            minutes = int(reply[14:16])
+            seconds = int(reply[17:19])
+            year_day = int(reply[24:27])
+            week_day = int(reply[28])
             is_dst = None  # no way to know yet
         except KeyError:
             raise KeyError(
                 "Was unable to lookup the time, try setting secrets['timezone'] according to http://worldtimeapi.org/timezones"  # pylint: disable=line-too-long
             )
-        year, month, mday = [int(x) for x in the_date.split("-")]
-        the_time = the_time.split(".")[0]
-        hours, minutes, seconds = [int(x) for x in the_time.split(":")]
         now = time.struct_time(
             (year, month, mday, hours, minutes, seconds, week_day, year_day, is_dst)
         )
@@ -720,23 +957,51 @@ class PyPortal:
             print(r.headers)
         content_length = int(r.headers["content-length"])
         remaining = content_length
-        print("Saving data to ", filename)
-        stamp = time.monotonic()
-        file = open(filename, "wb")
-        for i in r.iter_content(min(remaining, chunk_size)):  # huge chunks!
-            self.neo_status((0, 100, 100))
-            remaining -= len(i)
-            file.write(i)
+        halfway = content_length // 2
+        chunks = 0
+
+        def progress(count):  # called once remaining has been updated for count
+            nonlocal chunks
+            if remaining + count > halfway >= remaining:
+                self.neo_status((0, 100, 100))  # cyan = half way there
             if self._debug:
                 print(
                     "Read %d bytes, %d remaining"
                     % (content_length - remaining, remaining)
                 )
-            else:
+            elif not chunks % 8:  # each print is a slow USB write, keep them rare
                 print(".", end="")
+            chunks += 1
+
+        print("Saving data to ", filename)
+        if filename == self._bg_filename:
+            self._bg_filename = None  # the cached background is about to be overwritten
+        stamp = time.monotonic()
+        file = open(filename, "wb")
+        # gather what comes off the network into whole blocks, so the filesystem
+        # gets a few block sized writes rather than one per (possibly small) chunk
+        block_size = min(chunk_size, 4096)
+        if not self._wget_buf:
+            self._wget_buf = bytearray(4096)  # kept for reuse by later downloads
+        block = memoryview(self._wget_buf)[:block_size]
+
+        fill = 0
+        for i in r.iter_content(min(remaining, chunk_size)):  # huge chunks!
+            remaining -= len(i)
+            progress(len(i))
+            start = 0
+            while start < len(i):
+                count = min(len(i) - start, block_size - fill)
+                block[fill : fill + count] = memoryview(i)[start : start + count]
+                fill += count
+                start += count
+                if fill == block_size:
+                    file.write(block)
+                    fill = 0
             if not remaining:
                 break
-            self.neo_status((100, 100, 0))
+        if fill:
+            file.write(block[:fill])
         file.close()
 
         r.close()
@@ -849,13 +1114,22 @@ class PyPortal:
         and display text or graphics. This function does pretty much everything
         Optionally update the URL
         """
+        self._hold_refresh = True
+        try:
+            return self._fetch(refresh_url, timeout)
+        finally:
+            self._hold_refresh = False
+            self._flush_display()
+
+    def _fetch(self, refresh_url, timeout):
+        gc_collect = gc.collect  # called a lot, skip the module lookup each time
         if refresh_url:
             self._url = refresh_url
         json_out = None
+        extracted = False
         image_url = None
-        values = []
 
-        gc.collect()
+        gc_collect()
         if self._debug:
             print("Free mem: ", gc.mem_free())  # pylint: disable=no-member
 
@@ -869,9 +1143,9 @@ class PyPortal:
             # great, lets get the data
             print("Retrieving data...", end="")
             self.neo_status((100, 100, 0))  # yellow = fetching data
-            gc.collect()
+            gc_collect()
             r = requests.get(self._url, headers=self._headers, timeout=timeout)
-            gc.collect()
+            gc_collect()
             self.neo_status((0, 0, 100))  # green = got data
             print("Reply is OK!")
 
@@ -879,19 +1153,37 @@ class PyPortal:
             print(r.text)
 
         if self._image_json_path or self._json_path:
+            # transforms get the whole document, parsed straight off the socket when
+            # r.text isn't needed afterwards (it is for regexp_path or the raw body)
+            streamed = self._json_transform and self._json_path
+            # without transforms only the values at our paths are ever looked at,
+            # unless a path needs the whole document (empty) or its length (negative index)
+            paths = list(self._json_path or ())
+            if self._image_json_path:
+                paths.append(self._image_json_path)
+            paths.extend(self._image_dim_json_path or ())
+            extracted = not self._json_transform and all(
+                path and not any(isinstance(key, int) and key < 0 for key in path)
+                for path in paths
+            )
             try:
-                gc.collect()
-                json_out = r.json()
-                gc.collect()
+                gc_collect()
+                if extracted:
+                    json_out = PyPortal._extract_paths(r.content, paths)
+                elif streamed:
+                    json_out = PyPortal._stream_json(r)
+                else:
+                    json_out = r.json()
+                gc_collect()
             except ValueError:  # failed to parse?
-                print("Couldn't parse json: ", r.text)
+                if streamed:
+                    print("Couldn't parse json")
+                else:
+                    print("Couldn't parse json: ", r.text)
                 raise
             except MemoryError:
                 supervisor.reload()
 
-        if self._regexp_path:
-            import re  # pylint: disable=import-outside-toplevel
-
         if self._image_url_path:
             image_url = self._image_url_path
 
@@ -906,15 +1198,20 @@ class PyPortal:
 
         # extract desired text/values from json
         if self._json_path:
-            for path in self._json_path:
+            gc_collect()  # once for all the paths, traversing allocates nothing itself
+            values = [None] * len(self._json_path)
+            traverse = PyPortal._json_traverse
+            for i, path in enumerate(self._json_path):
                 try:
-                    values.append(PyPortal._json_traverse(json_out, path))
+                    values[i] = traverse(json_out, path)
                 except KeyError:
-                    print(json_out)
+                    print(r.text if extracted else json_out)
                     raise
         elif self._regexp_path:
-            for regexp in self._regexp_path:
-                values.append(re.search(regexp, r.text).group(1))
+            values = [None] * len(self._regexp_path)
+            text = r.text
+            for i, regexp in enumerate(self._regexp_path):
+                values[i] = regexp.search(text).group(1)
         else:
             values = r.text
 
@@ -937,14 +1234,23 @@ class PyPortal:
             print("image dim:", iwidth, iheight)
 
         # we're done with the requests object, lets delete it so we can do more!
+        # closing lets adafruit_requests reuse the kept-alive connection for the next fetch
         json_out = None
+        r.close()
         r = None
-        gc.collect()
+        gc_collect()
 
         if image_url:
             try:
                 print("original URL:", image_url)
-                if iwidth < iheight:
+                # a bitmap that is known to be the size we want can be used as it is,
+                # which saves the round trip through the converter service
+                direct = image_url.split("?")[0].lower().endswith(".bmp") and (
+                    (iwidth, iheight) == tuple(self._image_resize)
+                )
+                if direct:
+                    print("already a bitmap of the right size, not converting")
+                elif iwidth < iheight:
                     image_url = self.image_converter_url(
                         image_url,
                         int(
@@ -958,7 +1264,8 @@ class PyPortal:
                     image_url = self.image_converter_url(
                         image_url, self._image_resize[0], self._image_resize[1]
                     )
-                print("convert URL:", image_url)
+                if not direct:
+                    print("convert URL:", image_url)
                 # convert image to bitmap and cache
                 # print("**not actually wgetting**")
                 filename = "/cache.bmp"
@@ -966,6 +1273,19 @@ class PyPortal:
                 if self._sdcard:
                     filename = "/sd" + filename
                     chunk_size = 512  # current bug in big SD writes -> stick to 1 block
+                if iwidth < iheight and not direct:
+                    pwidth = int(
+                        self._image_resize[1]
+                        * self._image_resize[1]
+                        / self._image_resize[0]
+                    )
+                    position = (
+                        self._image_position[0]
+                        + int((self._image_resize[0] - pwidth) / 2),
+                        self._image_position[1],
+                    )
+                else:
+                    position = self._image_position
                 try:
                     self.wget(image_url, filename, chunk_size=chunk_size)
                 except OSError as error:
@@ -976,29 +1296,14 @@ class PyPortal:
                 except RuntimeError as error:
                     print(error)
                     raise RuntimeError("wget didn't write a complete file")
-                if iwidth < iheight:
-                    pwidth = int(
-                        self._image_resize[1]
-                        * self._image_resize[1]
-                        / self._image_resize[0]
-                    )
-                    self.set_background(
-                        filename,
-                        (
-                            self._image_position[0]
-                            + int((self._image_resize[0] - pwidth) / 2),
-                            self._image_position[1],
-                        ),
-                    )
-                else:
-                    self.set_background(filename, self._image_position)
+                self.set_background(filename, position)
 
             except ValueError as error:
                 print("Error displaying cached image. " + error.args[0])
                 self.set_background(self._default_bg)
             finally:
                 image_url = None
-                gc.collect()
+                gc_collect()
 
         # if we have a callback registered, call it now
         if self._success_callback:
@@ -1012,10 +1317,15 @@ class PyPortal:
                     func = self._text_transform[i]
                     string = func(values[i])
                 else:
-                    try:
-                        string = "{:,d}".format(int(values[i]))
-                    except (TypeError, ValueError):
-                        string = values[i]  # ok its a string
+                    # check the type up front, exceptions are slow on microcontrollers
+                    value = values[i]
+                    if isinstance(value, (int, float)) or (
+                        isinstance(value, str)
+                        and (value[1:] if value[:1] == "-" else value).isdigit()
+                    ):
+                        string = "{:,d}".format(int(value))
+                    else:
+                        string = value  # ok its a string
                 if self._debug:
                     print("Drawing text", string)
                 if self._text_wrap[i]:
@@ -1054,16 +1364,17 @@ class PyPortal:
 
         # pylint: disable=invalid-name
         # bitmap the size of the matrix, plus border, monochrome (2 colors)
-        qr_bitmap = displayio.Bitmap(
-            qrcode.matrix.width + 2, qrcode.matrix.height + 2, 2
-        )
-        for i in range(qr_bitmap.width * qr_bitmap.height):
-            qr_bitmap[i] = 0
+        matrix = qrcode.matrix
+        width = matrix.width
+        height = matrix.height
+        # a new bitmap starts out all 0 (white), so only the dark modules need setting
+        qr_bitmap = displayio.Bitmap(width + 2, height + 2, 2)
 
         # transcribe QR code into bitmap
-        for xx in range(qrcode.matrix.width):
-            for yy in range(qrcode.matrix.height):
-                qr_bitmap[xx + 1, yy + 1] = 1 if qrcode.matrix[xx, yy] else 0
+        for xx in range(width):
+            for yy in range(height):
+                if matrix[xx, yy]:
+                    qr_bitmap[xx + 1, yy + 1] = 1
 
         # display the QR code
         qr_sprite = displayio.TileGrid(qr_bitmap, pixel_shader=palette)
@@ -1107,15 +1418,20 @@ class PyPortal:
         string = string.replace("\n", "").replace("\r", "")  # strip confusing newlines
         words = string.split(" ")
         the_lines = []
-        the_line = ""
+        # collect the words of each line and join them once, rather than growing a string
+        line_words = []
+        line_len = 0
         for w in words:
-            if len(the_line + " " + w) <= max_chars:
-                the_line += " " + w
-            else:
-                the_lines.append(the_line)
-                the_line = "" + w
-        if the_line:  # last line remaining
-            the_lines.append(the_line)
-        # remove first space from first line:
-        the_lines[0] = the_lines[0][1:]
+            need = len(w) + 1 if line_words else len(w)
+            if line_words and line_len + need > max_chars:
+                the_lines.append(" ".join(line_words))
+                line_words = []
+                line_len = 0
+                need = len(w)
+            if not w and not line_words and the_lines:
+                continue  # don't carry spaces over a break
+            line_words.append(w)
+            line_len += need
+        if line_words:  # last line remaining
+            the_lines.append(" ".join(line_words))
         return the_lines